@@ -2,6 +2,9 @@ from src.db_api import Postgresql_DB_API as db_api
 import src.utils as utils
 import src.settings as settings
 from src.cash import CASH
+from itertools import islice
+import logging
+import sys
 
 # The name of the table storing input data
 data_table_name = "data"
@@ -11,32 +14,42 @@ def main():
     # Start Error Logging 
     utils.start_logging()
 
-    # Build connection and create cash database
+    # Create cash database and connect to it
     db = db_api()
-    db.connect()
     db.create_database(db_name=settings.DBNAME)
 
-    # Read Data, create tables and init tables
+    # Read Data, create tables and init tables. All setup statements are sent as one batch,
+    # which costs a single round-trip and commits once.
     utils.create_table_from_csv(db=db, table_name=data_table_name)
-    utils.init_helper_functions(db=db)
-    utils.create_tables(db=db)
-    utils.create_cash_functions(db=db)
-    utils.init_tables(db=db)
+    columns = utils.get_data_columns(db=db, table_name=data_table_name)
+    bounds = utils.get_column_bounds(db=db, columns=columns, table_name=data_table_name)
+    setup_statements = (
+        utils.init_helper_functions()
+        + utils.create_tables(columns=columns)
+        + utils.create_cash_functions(columns=columns)
+        + utils.init_tables(columns=columns, bounds=bounds)
+    )
+    db.execute_batch(statements=setup_statements, params=utils.init_table_params(columns=columns))
 
     # CASH Algorithm
     cash = CASH()
     cash.fit(db=db)
 
     # Print Result
-    result = db.execute_engine_query("SELECT cluster FROM clusters")
+    result = db.execute_engine_query("SELECT cluster FROM clusters", stream=True)
     print("----------------------Clusters Found----------------------")
     
-    for cluster in result:
-        print("Cluster: " + str(cluster))
+    # Write the clusters in chunks, one write per chunk instead of one print per cluster
+    while chunk := list(islice(result, 1000)):
+        sys.stdout.write("".join("Cluster: " + str(cluster) + "\n" for cluster in chunk))
 
     print("----------------------------------------------------------")
 
-    return result
+    db.close_connection()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except Exception:
+        logging.exception("Failed running CASH")
+        raise
@@ -1,5 +1,46 @@
 from src.db_api import Postgresql_DB_API
-from src.settings import MINPTS, EPS
+from src.settings import MINPTS, EPS, BATCH_SIZE, NUM_WORKERS
+
+# The CASH algorithm and its invocation only depend on the settings, so both are built once at import.
+_CASH_DDL = """CREATE OR REPLACE FUNCTION cash_batch(eps double precision, minPts int, batch_size int, worker_id int, num_workers int) RETURNS boolean AS $$
+            DECLARE
+            alphas double precision[];
+            batch int[];
+            pointer int;
+            BEGIN
+
+            IF NOT permutation_left(worker_id, num_workers)
+               OR (SELECT COUNT(*) FROM (SELECT 1 FROM data LIMIT minPts) AS objects) < minPts THEN
+                RETURN FALSE;
+            END IF;
+
+            batch := get_next_permutations(batch_size, worker_id, num_workers);
+            PERFORM insert_deltas(batch);
+            FOR perm IN 1..array_length(batch, 1) LOOP
+                pointer := nextval(pg_get_serial_sequence('clusters', 'clusterid'));
+                alphas := (SELECT permutations.alphas FROM permutations WHERE permutations.id = batch[perm]);
+
+                PERFORM extract_clusters(eps, minPts, perm, alphas);
+                IF EXISTS (SELECT 1 FROM clusters WHERE clusterid >= pointer) THEN
+                    PERFORM delete_clustered_objects(pointer);
+                END IF;
+            END LOOP;
+            DELETE FROM deltas;
+            RETURN TRUE;
+            END;
+        $$ LANGUAGE PLPGSQL;
+
+CREATE OR REPLACE PROCEDURE cash(eps double precision, minPts int, batch_size int, worker_id int, num_workers int) AS $$
+            BEGIN
+            WHILE cash_batch(eps, minPts, batch_size, worker_id, num_workers) LOOP
+                COMMIT;
+            END LOOP;
+            END;
+        $$ LANGUAGE PLPGSQL;
+"""
+
+_CASH_CALL = "CALL cash(:eps, :minpts, :batch_size, :worker_id, :num_workers)"
+_CASH_PARAMS = {"eps": EPS, "minpts": MINPTS, "batch_size": BATCH_SIZE, "num_workers": NUM_WORKERS}
 
 
 class CASH:
@@ -20,9 +61,8 @@ class CASH:
         Executes the CASH algorithm on the provided database instance.
 
         Description:
-        Defines and executes the CASH algorithm as a PostgreSQL function. This algorithm iterates
-        through permutations, calculates deltas, extracts clusters, filters them, deletes clustered
-        objects, and cleans the deltas table until the stopping conditions are met.
+        Defines the CASH algorithm as a PostgreSQL procedure and calls it, once per worker if NUM_WORKERS is
+        greater than one.
 
         Parameters:
         db (Postgresql_DB_API): The database API instance used for database operations.
@@ -30,40 +70,14 @@ class CASH:
         Returns:
         None
         """
-        cash = """CREATE OR REPLACE FUNCTION cash(eps double precision, minPts int) RETURNS void AS $$
-                    DECLARE
-                    alphas double precision[];
-                    clustered_objects int[];
-                    pointer int;
-                    p int;
-                    BEGIN
+        db.execute_engine_query(query=_CASH_DDL)
+        if NUM_WORKERS == 1:
+            db.call_procedure(query=_CASH_CALL, params={**_CASH_PARAMS, "worker_id": 0})
+            return
 
-                    p := 1;
-                    WHILE permutation_left() AND(SELECT COUNT(*) FROM data) >= minPts LOOP
-                        pointer := nextval(pg_get_serial_sequence('clusters', 'clusterid'));
-                        alphas := get_next_permutation();
-
-                        PERFORM update_next_permutation();
-                        PERFORM insert_deltas(alphas);
-                        PERFORM extract_clusters(eps, alphas);
-                        PERFORM filter_clusters(minPts);
-                        PERFORM delete_clustered_objects(pointer);
-                        PERFORM clean_deltas_table();
-                        p := p + 1;
-                    END LOOP;
-                    END;
-                $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=cash)
-        db.execute_engine_query(query=
-                """DO $$
-                        BEGIN
-                        PERFORM cash("""
-            + str(EPS)
-            + """, """
-            + str(MINPTS)
-            + """);
-                        END;
-                        $$;
-                    """
-            )
+        workers = [
+            db.call_procedure_async(query=_CASH_CALL, params={**_CASH_PARAMS, "worker_id": worker_id})
+            for worker_id in range(NUM_WORKERS)
+        ]
+        for worker in workers:
+            worker.result()
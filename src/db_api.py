@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine, text
-from src.settings import HOST, USER, PASSWORD
-from sqlalchemy.orm import sessionmaker
+from src.settings import HOST, USER, PASSWORD, NUM_WORKERS
+from concurrent.futures import Future, ThreadPoolExecutor
+import psycopg2
 
 
 class Postgresql_DB_API:
@@ -9,6 +10,7 @@ class Postgresql_DB_API:
         host: str = HOST,
         user: str = USER,
         password: str = PASSWORD,
+        max_workers: int = NUM_WORKERS,
     ) -> None:
         """
         Initializes the Postgresql_DB_API class with connection parameters.
@@ -21,20 +23,24 @@ class Postgresql_DB_API:
         host (str): Hostname of the PostgreSQL database.
         user (str): Username for the PostgreSQL database.
         password (str): Password for the PostgreSQL database.
+        max_workers (int): Maximum number of procedures executed concurrently by call_procedure_async.
         """
         self.host = host
         self.user = user
         self.password = password
+        self.max_workers = max_workers
         self.dbname = None
         self.engine = None
-        self.Session = None
+        self._conn = None
+        self._executor = None
+        self._url = None
 
     def connect(self):
         """
         Establishes a connection to the PostgreSQL database using SQLAlchemy.
 
         Description:
-        Establishes a connection to the PostgreSQL database using SQLAlchemy's create_engine.
+        Establishes a connection to the PostgreSQL database using SQLAlchemy's create_engine and keeps it open.
         If a database name is set, it connects to that specific database, otherwise it connects
         to the server without specifying a database.
 
@@ -42,16 +48,25 @@ class Postgresql_DB_API:
         None
         """
         if self.dbname:
-            self.engine = create_engine(
-                f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}/{self.dbname}",
-                isolation_level="AUTOCOMMIT"
-            )
+            url = f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}/{self.dbname}"
         else:
-            self.engine = create_engine(
-                f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}",
-                isolation_level="AUTOCOMMIT"
-            )
-        self.Session = sessionmaker(bind=self.engine)
+            url = f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}"
+
+        if self.engine is not None:
+            if self._url == url:
+                return
+            self.close_connection()
+
+        self._url = url
+        self.engine = create_engine(
+            url,
+            isolation_level="AUTOCOMMIT",
+            pool_size=1,
+            max_overflow=self.max_workers,
+            pool_pre_ping=False,
+            pool_reset_on_return=None
+        )
+        self._conn = self.engine.connect()
 
     def create_database(self, db_name: str):
         """
@@ -59,7 +74,8 @@ class Postgresql_DB_API:
 
         Description:
         Drops the database if it exists and then creates a new database with the specified name.
-        After creating the database, it sets up the SQLAlchemy engine to connect to this new database.
+        Both statements run on a short-lived psycopg2 connection to the server, so the SQLAlchemy
+        engine is only built once, against the new database.
 
         Parameters:
         dbname (str): The name of the database to be created.
@@ -67,12 +83,22 @@ class Postgresql_DB_API:
         Returns:
         None
         """
-        self.execute_engine_query(f"DROP DATABASE IF EXISTS {db_name}")
-        self.execute_engine_query(f"CREATE DATABASE {db_name}")
+        if self.engine is not None:
+            self.close_connection()
+
+        conn = psycopg2.connect(host=self.host, user=self.user, password=self.password)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS {db_name}")
+                cursor.execute(f"CREATE DATABASE {db_name}")
+        finally:
+            conn.close()
+
         self.dbname = db_name
         self.connect()
 
-    def execute_engine_query(self, query: str):
+    def execute_engine_query(self, query: str, params: dict = None, stream: bool = False):
         """
         Executes a SQL query using SQLAlchemy engine.
 
@@ -82,22 +108,130 @@ class Postgresql_DB_API:
 
         Parameters:
         query (str): The SQL query to be executed.
+        params (dict): Values for the query's bind parameters, if any.
+        stream (bool): Whether to return an iterator over the rows of a SELECT.
 
         Returns:
-        None
+        The rows of a SELECT (an iterator if stream is set), otherwise None.
         """
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query))
+        if stream:
+            return self._stream_query(query, params)
+
+        with self._conn.begin():
+            result = self._conn.execute(text(query), params)
             if query.strip().lower().startswith('select'):
                 return result.fetchall()
             return None
-        
+
+    def call_procedure(self, query: str, params: dict = None):
+        """
+        Calls a stored procedure.
+
+        Description:
+        Executes the given CALL statement on its own over the open connection. The connection is in
+        autocommit mode, so the call does not run inside a transaction block and the procedure
+        may COMMIT its work as it goes, making it visible to other connections right away.
+
+        Parameters:
+        query (str): The CALL statement to be executed.
+        params (dict): Values for the statement's bind parameters, if any.
+
+        Returns:
+        None
+        """
+        # In autocommit mode begin() does not send BEGIN, so the procedure still runs outside a transaction block.
+        with self._conn.begin():
+            self._conn.execute(text(query), params)
+
+    def call_procedure_async(self, query: str, params: dict = None) -> Future:
+        """
+        Calls a stored procedure in a background thread.
+
+        Description:
+        Like call_procedure, but the call runs in a thread pool of max_workers threads on its own
+        connection from the engine's pool, so several procedures are processed by separate server
+        backends at the same time.
+
+        Parameters:
+        query (str): The CALL statement to be executed.
+        params (dict): Values for the statement's bind parameters, if any.
+
+        Returns:
+        Future: A future resolving to None once the procedure returned.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor.submit(self._call_on_new_connection, query, params)
+
+    def _call_on_new_connection(self, query: str, params: dict = None):
+        with self.engine.connect() as conn:
+            conn.execute(text(query), params)
+
+    def _stream_query(self, query: str, params: dict = None, yield_per: int = 1000):
+        # Named (server-side) cursors only live inside a transaction, so the rows are streamed
+        # from a separate connection that is taken out of autocommit mode.
+        with self.engine.connect().execution_options(isolation_level="READ COMMITTED") as conn:
+            with conn.begin():
+                result = conn.execute(
+                    text(query),
+                    params,
+                    execution_options={"stream_results": True, "yield_per": yield_per}
+                )
+                for partition in result.partitions():
+                    yield from partition
+
+    def execute_batch(self, statements: list[str], params: dict = None):
+        """
+        Executes several SQL statements in a single round-trip.
+
+        Description:
+        Joins the given statements into one multi-statement string and executes it over the open
+        connection in a single round-trip.
+
+        Parameters:
+        statements (list[str]): The SQL statements to be executed, in order.
+        params (dict): Values for the statements' bind parameters, if any.
+
+        Returns:
+        None
+        """
+        batch = ";\n".join(statement.strip().rstrip(";") for statement in statements)
+        with self._conn.begin():
+            self._conn.execute(text(batch), params)
+
+    def copy_from_csv(self, table: str, csv_path: str, columns: list[str]):
+        """
+        Bulk loads a CSV file into a table.
+
+        Description:
+        Streams the CSV file to the server with COPY ... FROM STDIN on a raw psycopg2 connection,
+        so the rows are loaded in one bulk operation instead of one INSERT per row. The first line
+        of the file is treated as a header and skipped.
+
+        Parameters:
+        table (str): The name of the table to be loaded.
+        csv_path (str): The path to the CSV file.
+        columns (list[str]): The table columns, in the order they appear in the file.
+
+        Returns:
+        None
+        """
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        conn = self.engine.raw_connection()
+        try:
+            with conn.cursor() as cursor, open(csv_path, "r", encoding="utf-8") as csv_file:
+                cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH CSV HEADER", csv_file)
+            conn.commit()
+        finally:
+            conn.close()
+
     def close_connection(self):
         """
         Closes the connection to the PostgreSQL database.
 
         Description:
-        Closes the psycopg2 cursor and connection.
+        Closes the open connection, shuts down the background thread pool and disposes the
+        engine's connection pool.
 
         Parameters:
         None
@@ -105,5 +239,12 @@ class Postgresql_DB_API:
         Returns:
         None
         """
-        self.pgcursor.close()
-        self.pgconn.close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
@@ -1,18 +1,28 @@
+from typing import Final
+
 # The hostname of the PostgreSQL server.
-HOST = "localhost"
+HOST: Final[str] = "localhost"
 
 # The password for the PostgreSQL user.
-PASSWORD = "pwd"
+PASSWORD: Final[str] = "pwd"
 
 # The username for connecting to the PostgreSQL database.
-USER = "postgres"
+USER: Final[str] = "postgres"
 
 # The name of the PostgreSQL database.
-DBNAME = "cash"
+DBNAME: Final[str] = "cash"
 
-DATASET_PATH = "data/test_data.csv"
+DATASET_PATH: Final[str] = "data/test_data.csv"
 
 # Splits and Eps of Clustering Algorithm
-MINPTS = 3
-SPLITS = 4
-EPS = 2
+MINPTS: Final[int] = 3
+SPLITS: Final[int] = 4
+EPS: Final[float] = 2.0
+
+# Number of permutations whose deltas are computed together in one statement
+BATCH_SIZE: Final[int] = 8
+
+# Number of concurrent CASH workers, each on its own connection and share of the permutations.
+# Every batch is committed on its own and objects are locked when they are clustered, so an
+# object ends up in at most one cluster.
+NUM_WORKERS: Final[int] = 1
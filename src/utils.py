@@ -1,7 +1,6 @@
 from src.db_api import Postgresql_DB_API
 from src.settings import DATASET_PATH, SPLITS
-from datetime import datetime
-import pandas as pd
+import csv
 import logging
 import os
 
@@ -15,11 +14,14 @@ def start_logging(log_file_path: str = "logs/log.txt") -> None:
     Returns:
         None
     """
-    logs_dir = os.path.dirname(log_file_path)
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
+    os.makedirs(os.path.dirname(log_file_path) or ".", exist_ok=True)
 
-    logging.basicConfig(filename=log_file_path, filemode="a", level=logging.ERROR)
+    logging.basicConfig(
+        filename=log_file_path,
+        filemode="a",
+        level=logging.ERROR,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
 
 
 def create_table_from_csv(db: Postgresql_DB_API, table_name: str):
@@ -27,8 +29,9 @@ def create_table_from_csv(db: Postgresql_DB_API, table_name: str):
     Creates a table in the database from a CSV file.
 
     Description:
-    Reads data from a CSV file located at DATASET_PATH and creates a table with the specified
-    table_name in the database. Adds a primary key column 'oid' to the table.
+    Reads the header of the CSV file located at DATASET_PATH and creates a table with the specified
+    table_name in the database, with one double precision column per attribute. The rows are streamed
+    into the table with COPY without being parsed in Python. Adds a primary key column 'oid' to the table.
 
     Parameters:
     db (Postgresql_DB_API): The database API instance used for database operations.
@@ -37,490 +40,343 @@ def create_table_from_csv(db: Postgresql_DB_API, table_name: str):
     Returns:
     None
     """
-    try:
-        data = pd.read_csv(DATASET_PATH, sep=",", encoding='utf-8')
-        data.to_sql(table_name, db.engine, if_exists="replace", index=False)
-        db.execute_engine_query(f"ALTER TABLE {table_name} ADD COLUMN oid SERIAL PRIMARY KEY;")
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating table '{table_name}' from CSV: {e}")
+    with open(DATASET_PATH, "r", encoding="utf-8-sig", newline="") as csv_file:
+        columns = next(csv.reader(csv_file, delimiter=","))
+    column_defs = ", ".join(f'"{column}" double precision' for column in columns)
+    db.execute_batch(statements=[
+        f"DROP TABLE IF EXISTS {table_name}",
+        f"CREATE TABLE {table_name} ({column_defs})",
+    ])
+    db.copy_from_csv(table=table_name, csv_path=DATASET_PATH, columns=columns)
+    db.execute_engine_query(f"ALTER TABLE {table_name} ADD COLUMN oid SERIAL PRIMARY KEY;")
 
 
-def init_helper_functions(db: Postgresql_DB_API):
+def get_data_columns(db: Postgresql_DB_API, table_name: str = "data"):
     """
-    Initializes helper functions and extensions in the database.
+    Retrieves the attribute columns of the data table.
 
     Description:
-    Creates necessary extensions and calculation functions in the database.
+    Queries the information schema once for the columns of the table, excluding the 'oid' column, in table order. The
+    column names are used to generate SQL that references the attributes directly instead of looking them up per row.
 
     Parameters:
     db (Postgresql_DB_API): The database API instance used for database operations.
+    table_name (str): The name of the data table.
 
     Returns:
-    None
+    list[str]: The names of the attribute columns.
     """
-    try:
-        create_extensions(db=db)
-        create_calculation_functions(db=db)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed initializing helper functions: {e}")
+    rows = db.execute_engine_query(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = :table_name AND column_name != 'oid' ORDER BY ordinal_position",
+        params={"table_name": table_name}
+    )
+    return [row[0] for row in rows]
 
 
-def create_extensions(db: Postgresql_DB_API):
+def get_column_bounds(db: Postgresql_DB_API, columns: list[str], table_name: str = "data"):
     """
-    Creates necessary PostgreSQL extensions.
+    Retrieves the value range of every attribute column.
 
     Description:
-    Creates the 'intarray' extension in the database.
+    Queries the minimum and maximum of all attribute columns with a single scan of the table.
 
     Parameters:
     db (Postgresql_DB_API): The database API instance used for database operations.
+    columns (list[str]): The attribute columns of the table.
+    table_name (str): The name of the data table.
 
     Returns:
-    None
+    list[tuple]: The minimum and maximum of every column, in the order of columns.
     """
-    try:
-        db.execute_engine_query(query="CREATE EXTENSION intarray;")
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating 'intarray' extension: {e}")
+    aggregates = ", ".join(f'min("{column}"), max("{column}")' for column in columns)
+    row = db.execute_engine_query(f"SELECT {aggregates} FROM {table_name}")[0]
+    return [(row[2 * i], row[2 * i + 1]) for i in range(len(columns))]
 
 
-def create_calculation_functions(db: Postgresql_DB_API):
+def init_helper_functions():
     """
-    Creates necessary calculation functions in the database.
+    Initializes helper functions and extensions in the database.
 
     Description:
-    Creates various calculation functions needed for data processing.
+    Collects the statements creating the necessary extensions and calculation functions in the database.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    list[str]: The SQL statements creating the extensions and calculation functions.
     """
-    try:
-        create_euclidian_dist_function(db=db)
-        create_parameterization_function(db=db)
-        create_dimensions_function(db=db)
-        create_get_object_function(db=db)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating calculation functions: {e}")
+    return [create_extensions()] + create_calculation_functions()
 
 
-def create_euclidian_dist_function(db: Postgresql_DB_API):
+def create_extensions():
     """
-    Creates the Euclidean distance calculation function.
+    Creates necessary PostgreSQL extensions.
 
     Description:
-    Creates a PostgreSQL function to calculate the Euclidean distance between two points.
+    Creates the 'intarray' extension in the database.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    str: The SQL statement creating the extension.
     """
-    try:
-        euclidian_dist_func = """CREATE OR REPLACE FUNCTION euclidiandist(n1 double precision, n2 double precision) RETURNS double precision AS $$
-                                 DECLARE 
-                                   result double precision;
-                                 BEGIN 
-                                   result := |/ ((n1 - n2) ^ 2);
-                                   RETURN result;
-                                 END;
-                                 $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=euclidian_dist_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating Euclidean distance function: {e}")
+    return "CREATE EXTENSION intarray;"
 
 
-def create_parameterization_function(db: Postgresql_DB_API):
+def create_calculation_functions():
     """
-    Creates the parameterization calculation function.
+    Creates necessary calculation functions in the database.
 
     Description:
-    Creates a PostgreSQL function to perform parameterization calculations on input arrays.
+    Collects the statements creating the various calculation functions needed for data processing. All of them only
+    compute values, so they are declared IMMUTABLE and PARALLEL SAFE.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
-
-    Returns:
     None
-    """
-    try:
-        paramfunc = """CREATE OR REPLACE FUNCTION parameterizationfunc(p double precision[], alphas double precision[]) RETURNS double precision AS $$
-                       DECLARE 
-                        delta double precision;
-                        subsum double precision; 
-                        d int; 
-                       BEGIN
-                        delta := 0;
-                        subsum := 0; 
-                        d := get_dimension();
-
-                        alphas := alphas || 0;
-
-                        FOR i IN 1..d LOOP
-                          subsum := p[i];
-                          FOR j IN 1..(i-1) LOOP
-                            subsum := subsum * sind(alphas[j]);
-                          END LOOP;
-                          subsum := subsum * cosd(alphas[i]);
-                          delta := delta + subsum; 
-                        END LOOP;
-
-                        RETURN delta;
-                       END;
-                       $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=paramfunc)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating parameterization function: {e}")
-
-
-def create_dimensions_function(db: Postgresql_DB_API):
-    """
-    Creates the get_dimension function.
-
-    Description:
-    Creates a PostgreSQL function to get the number of dimensions (columns) in the 'data' table.
-
-    Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
 
     Returns:
-    None
+    list[str]: The SQL statements creating the calculation functions.
     """
-    try:
-        query = """CREATE OR REPLACE FUNCTION get_dimension() RETURNS int AS $$
-                    BEGIN
-                      RETURN(SELECT COUNT(*) - 1 AS num_of_cols
-                             FROM information_schema.columns 
-                             WHERE table_name = 'data');
-                    END; 
-                    $$ LANGUAGE PLPGSQL;
-                """
-        db.execute_engine_query(query=query)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating get_dimension function: {e}")
+    return [
+        create_parameterization_function(),
+        create_zorder_key_function(),
+    ]
 
 
-def create_get_object_function(db: Postgresql_DB_API):
+def create_parameterization_function():
     """
-    Creates the get_object function.
+    Creates the parameterization calculation function.
 
     Description:
-    Creates a PostgreSQL function to retrieve an array of attribute values for a given object ID.
+    Creates a PostgreSQL function that parameterizes an object's coordinates with the precomputed sines and cosines of a
+    permutation.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        query = """ CREATE OR REPLACE FUNCTION get_object(id int) RETURNS double precision[] AS $$
-                        DECLARE
-                            attr text[];
-                            q text;
-                            res double precision[];
-                        BEGIN
-                            q := 'SELECT ARRAY[';
-                            
-                            attr := ARRAY(SELECT column_name FROM information_schema.columns WHERE table_name = 'data' AND column_name != 'oid');
-                            q := q || array_to_string(attr, ',', '*') || '] FROM data WHERE oid = ' || id;
-                            EXECUTE q INTO res;
-                            RETURN res;
-                        END
-                    $$ LANGUAGE PLPGSQL
-        """
-        db.execute_engine_query(query=query)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating get_object function: {e}")
+    paramfunc = """CREATE OR REPLACE FUNCTION parameterizationfunc(p double precision[], sins double precision[], coss double precision[]) RETURNS double precision AS $$
+                   WITH RECURSIVE sin_products(i, product) AS (
+                     SELECT 1, 1::double precision
+                     UNION ALL
+                     SELECT i + 1, product * sins[i]
+                     FROM sin_products
+                     WHERE i < array_length(p, 1)
+                   )
+                   SELECT COALESCE(SUM(p[i] * product * coss[i]), 0)
+                   FROM sin_products;
+                   $$ LANGUAGE SQL IMMUTABLE STRICT PARALLEL SAFE;
+    """
+    return paramfunc
 
 
-def create_tables(db: Postgresql_DB_API):
+def create_zorder_key_function():
     """
-    Creates necessary tables in the database.
+    Creates the zorder_key function.
 
     Description:
-    Creates the tables 'alphas', 'deltas', 'clusters', and 'next_permutation' in the database.
+    Creates a PostgreSQL function that interleaves the bits of quantized coordinates into a Z-order (Morton) key, so
+    that objects close to each other in data space get close keys.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    q (int[]): The quantized, non-negative coordinates of an object.
+    bits (int): The number of bits taken from every coordinate.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
+    """
+    zorder_func = """CREATE OR REPLACE FUNCTION zorder_key(q int[], bits int) RETURNS bigint AS $$
+                     DECLARE
+                       key bigint;
+                     BEGIN
+                       key := 0;
+                       FOR b IN REVERSE (bits - 1)..0 LOOP
+                         FOR i IN 1..array_length(q, 1) LOOP
+                           key := (key << 1) | ((q[i] >> b) & 1);
+                         END LOOP;
+                       END LOOP;
+                       RETURN key;
+                     END;
+                     $$ LANGUAGE PLPGSQL IMMUTABLE PARALLEL SAFE;
     """
-    try:
-        create_alphas_table(db=db)
-        create_deltas_table(db=db)
-        create_clusters_table(db=db)
-        create_next_permutation_table(db=db)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating tables: {e}")
+    return zorder_func
 
 
-def create_alphas_table(db: Postgresql_DB_API):
+def create_tables(columns: list[str]):
     """
-    Creates the 'alphas' table.
+    Creates necessary tables in the database.
 
     Description:
-    Creates the 'alphas' table with columns 'aid' and 'deg'.
+    Collects the statements creating the tables 'deltas', 'clusters', and 'permutations' in the database.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    columns (list[str]): The attribute columns of the 'data' table.
 
     Returns:
-    None
+    list[str]: The SQL statements creating the tables.
     """
-    try:
-        alphas_table = """CREATE TABLE alphas (
-                          aid int PRIMARY KEY, 
-                          deg double precision
-                         );
-        """
-        db.execute_engine_query(query=alphas_table)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating 'alphas' table: {e}")
+    return [
+        create_deltas_table(),
+        create_clusters_table(len(columns)),
+        create_permutations_table(),
+    ]
 
 
-def create_deltas_table(db: Postgresql_DB_API):
+def create_deltas_table():
     """
     Creates the 'deltas' table.
 
     Description:
-    Creates the 'deltas' table with columns 'oid' and 'delta', where 'oid' references the 'data' table.
+    Creates the unlogged 'deltas' table with columns 'oid', 'pid' and 'delta', where 'pid' is the position of the
+    permutation within the current batch, and indexes it by 'pid' and 'delta' and by 'oid'.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    str: The SQL statement creating the table.
     """
-    try:
-        deltas_table = """CREATE TABLE deltas (
-                          oid int,
-                          delta double precision,
-                          FOREIGN KEY(oid) REFERENCES data(oid)
-                         );
-        """
-        db.execute_engine_query(query=deltas_table)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating 'deltas' table: {e}")
+    deltas_table = """CREATE UNLOGGED TABLE deltas (
+                      oid int,
+                      pid int,
+                      delta double precision
+                     );
+                     CREATE INDEX deltas_pid_delta_idx ON deltas (pid, delta);
+                     CREATE INDEX deltas_oid_idx ON deltas (oid);
+    """
+    return deltas_table
 
 
-def create_clusters_table(db: Postgresql_DB_API):
+def create_clusters_table(dimension: int):
     """
-    Creates the 'clusters' table using a PL/pgSQL function.
+    Creates the 'clusters' table.
 
     Description:
-    Creates a PostgreSQL function to dynamically create the 'clusters' table based on the number of dimensions in the 'data' table.
+    Creates the 'clusters' table with columns 'clusterid', 'cluster' and one column 'deg<i>' per alpha of a permutation,
+    i.e. one less than the number of dimensions of the 'data' table.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    dimension (int): The number of attribute columns of the 'data' table.
 
     Returns:
-    None
+    str: The SQL statement creating the table.
     """
-    try:
-        clusters_table = """CREATE OR REPLACE FUNCTION create_clusters_table() RETURNS void AS $$
-                          DECLARE
-                            c_table text;
-                            alphas int;
-                          BEGIN
-                            c_table := 'CREATE TABLE clusters(clusterid serial PRIMARY KEY, cluster int[], ';
-                            alphas = (SELECT get_dimension()) - 1;
-                                FOR alpha in 0..(alphas-1) LOOP
-                                    c_table := c_table || 'deg' || alpha || ' double precision, ';
-                                END LOOP;
-                                c_table := left(c_table, -2);
-                                c_table := c_table || ');';
-                                EXECUTE c_table;
-                          END;
-                        $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=clusters_table)
-        db.execute_engine_query(query =  """DO $$
-                                            BEGIN
-                                            PERFORM create_clusters_table();
-                                            END;
-                                            $$;
-                                        """)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating 'clusters' table: {e}")
-
-
-def create_next_permutation_table(db: Postgresql_DB_API):
-    """
-    Creates the 'next_permutation' table.
+    deg_columns = "".join(f", deg{alpha} double precision" for alpha in range(dimension - 1))
+    clusters_table = "CREATE TABLE clusters(clusterid serial PRIMARY KEY, cluster int[]" + deg_columns + ");"
+    return clusters_table
+
+
+def create_permutations_table():
+    """
+    Creates the 'permutations' table.
 
     Description:
-    Creates the 'next_permutation' table with columns 'rid' and 'rowpointer'.
+    Creates the unlogged 'permutations' table with columns 'id', 'alphas', 'sins', 'coss' and 'consumed', where 'sins'
+    and 'coss' hold the sines and cosines of the alphas.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
-    """
-    try:
-        next_permutation_table ="""CREATE TABLE next_permutation(
-                                rid int PRIMARY KEY,
-                                rowpointer int 
-                                );
-                                """
-        db.execute_engine_query(query=next_permutation_table)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating 'next_permutation' table: {e}")
+    str: The SQL statements creating the table.
+    """
+    permutations_table = """CREATE UNLOGGED TABLE permutations(
+                            id serial PRIMARY KEY,
+                            alphas double precision[],
+                            sins double precision[],
+                            coss double precision[],
+                            consumed boolean DEFAULT FALSE
+                            );
+                            """
+    return permutations_table
 
 
-def create_cash_functions(db: Postgresql_DB_API):
+def create_cash_functions(columns: list[str]):
     """
     Creates all necessary functions for the CASH algorithm.
 
     Description:
-    Calls individual functions to create various components needed for the CASH algorithm, including functions for permutations,
+    Collects the statements of the individual functions needed for the CASH algorithm, including functions for permutations,
     clusters, and data management.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    columns (list[str]): The attribute columns of the 'data' table.
 
     Returns:
-    None
+    list[str]: The SQL statements creating the CASH functions.
     """
-    try:
-        create_get_next_permutation_function(db=db)
-        create_permutation_left_function(db=db)
-        create_update_next_permutation_function(db=db)
-        create_insert_cluster_function(db=db)
-        create_delete_deltas_by_oid_function(db=db)
-        create_insert_deltas_function(db=db)
-        create_extract_cluster_function(db=db)
-        create_filter_clusters_function(db=db)
-        create_delete_clustered_objects_function(db=db)
-        create_clean_deltas_table_function(db=db)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating CASH functions: {e}")
+    return [
+        create_get_next_permutations_function(),
+        create_permutation_left_function(),
+        create_insert_cluster_function(),
+        create_delete_deltas_by_oid_function(),
+        create_insert_deltas_function(columns),
+        create_extract_cluster_function(),
+        create_delete_clustered_objects_function(),
+    ]
 
 
-def create_get_next_permutation_function(db: Postgresql_DB_API):
+def create_get_next_permutations_function():
     """
-    Creates the get_next_permutation function.
+    Creates the get_next_permutations function.
 
     Description:
-    Creates a PostgreSQL function to get the next permutation of alphas.
+    Creates a PostgreSQL function that marks the next pending permutations of a worker as consumed and returns their
+    IDs. A worker owns the permutations whose ID modulo the number of workers equals its worker ID.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    n (int): The maximum number of permutations to return.
+    worker_id (int): The ID of the worker, starting at 0.
+    num_workers (int): The number of workers the permutations are split across.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        next_permutation_func = """CREATE OR REPLACE FUNCTION get_next_permutation() RETURNS double precision[] AS $$
-                                    DECLARE
-                                        rows_to_select int[];
-                                        alphas double precision[];
-                                    BEGIN
-                                        rows_to_select := (SELECT array_agg(rowpointer) FROM next_permutation WHERE rid != 0); 
-                                        FOR r in 1..array_length(rows_to_select, 1) LOOP
-                                            alphas := array_append(alphas, (SELECT deg FROM alphas WHERE aid = rows_to_select[r]));
-                                        END LOOP;
-                                        
-                                        RETURN alphas;
-                                    END;
-                                $$ LANGUAGE PLPGSQL   
-        """
-        db.execute_engine_query(query=next_permutation_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating get_next_permutation function: {e}")
-
-
-def create_permutation_left_function(db: Postgresql_DB_API):
+    next_permutations_func = """CREATE OR REPLACE FUNCTION get_next_permutations(n int, worker_id int, num_workers int) RETURNS int[] AS $$
+                                WITH next AS (
+                                    SELECT id FROM permutations
+                                    WHERE NOT consumed AND mod(id, num_workers) = worker_id
+                                    ORDER BY id LIMIT n
+                                ), taken AS (
+                                    UPDATE permutations SET consumed = TRUE
+                                    FROM next
+                                    WHERE permutations.id = next.id
+                                    RETURNING permutations.id
+                                )
+                                SELECT array_agg(taken.id ORDER BY taken.id) FROM taken;
+                            $$ LANGUAGE SQL VOLATILE PARALLEL UNSAFE;   
     """
-    Creates the permutation_left function.
-
-    Description:
-    Creates a PostgreSQL function to check if there are permutations left.
-
-    Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
-
-    Returns:
-    None
-    """
-    try:
-        permutation_left_func = """CREATE OR REPLACE FUNCTION permutation_left() RETURNS boolean AS $$ 
-                                    DECLARE 
-                                        val int;
-                                        maxval int;
-                                    BEGIN
-                                        maxval := (SELECT MAX(aid) FROM alphas);
-                                        val := (SELECT rowpointer FROM next_permutation WHERE rid = 1);
-                                        
-                                        IF val > maxval THEN 
-                                            RETURN false;
-                                        END IF;
-                                        RETURN true;
-                                    END; 
-                                $$ LANGUAGE PLPGSQL;
-                            """
-        db.execute_engine_query(query=permutation_left_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating permutation_left function: {e}")
+    return next_permutations_func
 
 
-def create_update_next_permutation_function(db: Postgresql_DB_API):
+def create_permutation_left_function():
     """
-    Creates the update_next_permutation function.
+    Creates the permutation_left function.
 
     Description:
-    Creates a PostgreSQL function to update the next permutation of alphas.
+    Creates a PostgreSQL function to check if there are permutations left for a worker. The function is a plain SQL
+    expression, so the planner can inline it into the calling query.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    worker_id (int): The ID of the worker, starting at 0.
+    num_workers (int): The number of workers the permutations are split across.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        update_func = """CREATE OR REPLACE FUNCTION update_next_permutation() RETURNS void AS $$
-                            DECLARE
-                                val int;
-                                pointer int;
-                                maxrow int;
-                                maxval int;
-                            BEGIN
-                                maxrow := (SELECT MAX(rid) FROM next_permutation);
-                                pointer := (SELECT rowpointer FROM next_permutation WHERE rid = 0);
-                                val := (SELECT rowpointer FROM next_permutation WHERE rid = pointer);
-                                maxval := (SELECT MAX(aid) FROM alphas);
-                                
-                                WHILE val >= maxval LOOP
-                                    IF pointer = 1 THEN 
-                                    UPDATE next_permutation SET rowpointer = maxval + 1 WHERE rid = pointer;
-                                    RETURN;
-                                    END IF;
-                                
-                                    UPDATE next_permutation SET rowpointer = 1 WHERE rid = pointer;
-                                    pointer := pointer - 1;
-                                    val := (SELECT rowpointer FROM next_permutation WHERE rid = pointer);
-                                END LOOP;
-                                
-                                UPDATE next_permutation SET rowpointer = val + 1 WHERE rid = pointer;
-                                IF pointer < maxrow THEN
-                                    pointer := pointer + 1;
-                                END IF;
-                            END;
-                        $$ LANGUAGE PLPGSQL;
-                    """
-        db.execute_engine_query(query=update_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating update_next_permutation function: {e}")
+    permutation_left_func = """CREATE OR REPLACE FUNCTION permutation_left(worker_id int, num_workers int) RETURNS boolean AS $$ 
+                                SELECT EXISTS (SELECT 1 FROM permutations WHERE NOT consumed AND mod(id, num_workers) = worker_id);
+                            $$ LANGUAGE SQL STABLE PARALLEL SAFE;
+                        """
+    return permutation_left_func
 
 
-def create_insert_cluster_function(db: Postgresql_DB_API):
+def create_insert_cluster_function():
     """
     Creates the insert_cluster function.
 
@@ -528,329 +384,296 @@ def create_insert_cluster_function(db: Postgresql_DB_API):
     Creates a PostgreSQL function to insert a cluster into the 'clusters' table.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
     cl (int[]): An array of cluster IDs.
     alphas (double precision[]): An array of alpha values.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
+    """
+    insert_cluster_function = """CREATE OR REPLACE FUNCTION insert_cluster(cl int[], alphas double precision[]) RETURNS void AS $$
+                                BEGIN
+                                    EXECUTE ('INSERT INTO clusters
+                                            VALUES(nextval(pg_get_serial_sequence(''clusters'', ''clusterid'')), 
+                                            sort(ARRAY[' || array_to_string(cl, ',', '*') || ']), ' 
+                                            || array_to_string(alphas, ',', '*') || ');');
+                                END;
+                           $$ LANGUAGE PLPGSQL VOLATILE PARALLEL UNSAFE;    
     """
-    try:
-        insert_cluster_function = """CREATE OR REPLACE FUNCTION insert_cluster(cl int[], alphas double precision[]) RETURNS void AS $$
-                                    BEGIN
-                                        EXECUTE ('INSERT INTO clusters
-                                                VALUES(nextval(pg_get_serial_sequence(''clusters'', ''clusterid'')), 
-                                                sort(ARRAY[' || array_to_string(cl, ',', '*') || ']), ' 
-                                                || array_to_string(alphas, ',', '*') || ');');
-                                    END;
-                               $$ LANGUAGE PLPGSQL;    
-        """
-        db.execute_engine_query(query=insert_cluster_function)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating insert_cluster function: {e}")
+    return insert_cluster_function
 
 
-def create_delete_deltas_by_oid_function(db: Postgresql_DB_API):
+def create_delete_deltas_by_oid_function():
     """
     Creates the delete_deltas_by_oids function.
 
     Description:
-    Creates a PostgreSQL function to delete delta entries by their object IDs.
+    Creates a PostgreSQL function to delete the delta entries of one permutation by their object IDs in a single
+    statement.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
     oid_arr (int[]): An array of object IDs.
+    perm (int): The position of the permutation within the current batch.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        delete_function = """CREATE OR REPLACE FUNCTION delete_deltas_by_oids(oid_arr int[]) RETURNS void AS $$
-                            BEGIN
-                                FOR o in 1..array_length(oid_arr, 1) LOOP
-                                    DELETE FROM deltas WHERE deltas.oid = oid_arr[o];
-                                END LOOP;
-                            END;
-                        $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=delete_function)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating delete_deltas_by_oids function: {e}")
+    delete_function = """CREATE OR REPLACE FUNCTION delete_deltas_by_oids(oid_arr int[], perm int) RETURNS void AS $$
+                        BEGIN
+                            DELETE FROM deltas WHERE deltas.pid = perm AND deltas.oid = ANY(oid_arr);
+                        END;
+                    $$ LANGUAGE PLPGSQL VOLATILE PARALLEL UNSAFE;
+    """
+    return delete_function
 
 
-def create_insert_deltas_function(db: Postgresql_DB_API):
+def create_insert_deltas_function(columns: list[str]):
     """
     Creates the insert_deltas function.
 
     Description:
-    Creates a PostgreSQL function to insert an entry into the 'deltas' table based on alpha values.
+    Creates a PostgreSQL function to insert the entries of the 'deltas' table for every object and every permutation of
+    a batch.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
-    alphas (double precision[]): An array of alpha values.
+    columns (list[str]): The attribute columns of the 'data' table.
+    batch (int[]): The IDs of the permutations, where the position of an ID in the array is its 'pid' in 'deltas'.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        insert_deltas_function = """CREATE OR REPLACE FUNCTION insert_deltas(alphas double precision[]) RETURNS void AS $$
-                                BEGIN 
-                                
-                                    INSERT INTO deltas
-                                    SELECT oid, parameterizationfunc(get_object(oid), alphas)
-                                    FROM data;
-                                
-                                END
-                              $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=insert_deltas_function)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating insert_deltas function: {e}")
+    object_array = "ARRAY[" + ", ".join(f'"{column}"' for column in columns) + "]::double precision[]"
+    insert_deltas_function = """CREATE OR REPLACE FUNCTION insert_deltas(batch int[]) RETURNS void AS $$
+                            BEGIN 
+                            
+                                INSERT INTO deltas
+                                SELECT d.oid, b.pid, parameterizationfunc(d.p, pm.sins, pm.coss)
+                                FROM (SELECT oid, """ + object_array + """ AS p FROM data) AS d,
+                                     unnest(batch) WITH ORDINALITY AS b(id, pid)
+                                     JOIN permutations AS pm ON pm.id = b.id;
+                            
+                            END
+                          $$ LANGUAGE PLPGSQL VOLATILE PARALLEL UNSAFE;
+    """
+    return insert_deltas_function
 
 
-def create_extract_cluster_function(db: Postgresql_DB_API):
+def create_extract_cluster_function():
     """
     Creates the extract_clusters function.
 
     Description:
-    Creates a PostgreSQL function to extract clusters based on epsilon and alpha values.
+    Creates a PostgreSQL function to extract the clusters of one permutation of the current batch based on epsilon and
+    alpha values. Objects that a concurrent worker has already deleted or is clustering are left out of a cluster.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
     eps (double precision): The epsilon value for clustering.
+    minPts (int): The minimum number of points required for a cluster.
+    perm (int): The position of the permutation within the current batch.
     alphas (double precision[]): An array of alpha values.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
     """
-    try:
-        extract_func = """CREATE OR REPLACE FUNCTION extract_clusters(eps double precision, alphas double precision[]) RETURNS void AS $$
-                            DECLARE
-                                q text;
-                                next_cluster int[];
-                                cluster_id int;
-                            BEGIN
-                                q :=  'SELECT sort(array_agg(d2.oid) || d1.oid) 
-                                       FROM deltas AS d1, deltas AS d2
-                                       WHERE d1.oid != d2.oid AND euclidiandist(d1.delta, d2.delta) <= ' || eps || '  
-                                       GROUP BY d1.oid
-                                       ORDER BY array_length(array_agg(d2.oid) || d1.oid, 1) DESC
-                                       LIMIT 1';
-                                EXECUTE q INTO next_cluster;
-                                
-                                WHILE next_cluster IS NOT NULL LOOP
+    extract_func = """CREATE OR REPLACE FUNCTION extract_clusters(eps double precision, minPts int, perm int, alphas double precision[]) RETURNS void AS $$
+                        DECLARE
+                            next_cluster int[];
+                            claimed int[];
+                        BEGIN
+                            LOOP
+                                SELECT sort(array_agg(d2.oid) || d1.oid) INTO next_cluster
+                                FROM deltas AS d1
+                                JOIN deltas AS d2
+                                  ON d2.pid = d1.pid
+                                 AND d2.delta BETWEEN d1.delta - eps AND d1.delta + eps
+                                 AND d2.oid != d1.oid
+                                WHERE d1.pid = perm
+                                GROUP BY d1.oid
+                                HAVING count(*) + 1 >= minPts
+                                ORDER BY count(*) DESC
+                                LIMIT 1;
+                                EXIT WHEN next_cluster IS NULL;
+
+                                -- Rolling back the sub-block releases the locks of a partial claim, while claimed keeps its value.
+                                BEGIN
+                                    claimed := ARRAY(
+                                        SELECT data.oid FROM data
+                                        WHERE data.oid = ANY(next_cluster)
+                                        ORDER BY data.oid
+                                        FOR UPDATE SKIP LOCKED
+                                    );
+                                    IF cardinality(claimed) < cardinality(next_cluster) THEN
+                                        RAISE EXCEPTION USING ERRCODE = 'lock_not_available';
+                                    END IF;
+                                EXCEPTION
+                                    WHEN lock_not_available THEN NULL;
+                                END;
+                                IF cardinality(claimed) = cardinality(next_cluster) THEN
                                     PERFORM insert_cluster(next_cluster, alphas);
-                                    PERFORM delete_deltas_by_oids(next_cluster);
-                                    EXECUTE q INTO next_cluster;
-                                END LOOP;
-                            END;
-                        $$ LANGUAGE PLPGSQL;    
-        """
-        db.execute_engine_query(query=extract_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating extract_clusters function: {e}")
+                                    PERFORM delete_deltas_by_oids(next_cluster, perm);
+                                ELSE
+                                    PERFORM delete_deltas_by_oids(next_cluster - claimed, perm);
+                                END IF;
+                            END LOOP;
+                        END;
+                    $$ LANGUAGE PLPGSQL VOLATILE PARALLEL UNSAFE;    
+    """
+    return extract_func
 
 
-def create_filter_clusters_function(db: Postgresql_DB_API):
+def create_delete_clustered_objects_function():
     """
-    Creates the filter_clusters function.
+    Creates the delete_clustered_objects function.
 
     Description:
-    Creates a PostgreSQL function to filter clusters by a minimum number of points.
+    Creates a PostgreSQL function to delete clustered objects from the 'data' and 'deltas' tables. The objects of all new
+    clusters are collected with one query, and a single statement removes the objects from 'data' and their deltas.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
-    minPts (int): The minimum number of points required for a cluster.
+    startid (int): The starting cluster ID from which to delete objects.
 
     Returns:
-    None
+    str: The SQL statement creating the function.
+    """
+    delete_clustered_objects_func = """CREATE OR REPLACE FUNCTION delete_clustered_objects(startid int) RETURNS void AS $$
+                                        DECLARE
+                                            objects_to_delete int[];
+                                        BEGIN
+                                            objects_to_delete := ARRAY(
+                                                SELECT DISTINCT o
+                                                FROM clusters, unnest(clusters.cluster) AS o
+                                                WHERE clusters.clusterid >= startid
+                                            );
+                                            IF cardinality(objects_to_delete) = 0 THEN
+                                                RETURN;
+                                            END IF;
+                                            WITH del AS (
+                                                DELETE FROM data
+                                                WHERE oid IN (SELECT oid FROM data WHERE oid = ANY(objects_to_delete) FOR UPDATE SKIP LOCKED)
+                                                RETURNING oid
+                                            )
+                                            DELETE FROM deltas WHERE oid IN (SELECT oid FROM del);
+                                        END;
+                                    $$ LANGUAGE PLPGSQL VOLATILE PARALLEL UNSAFE;  
+    """
+    return delete_clustered_objects_func
+
+
+# The alpha and permutation statements only take bind parameters, so they are built once at import.
+_CREATE_ALPHAS_VIEW = """CREATE VIEW alphas (aid, deg, sin_deg, cos_deg) AS
+                    SELECT g + 1, a.alpha, sind(a.alpha), cosd(a.alpha)
+                    FROM (SELECT CAST(:low AS double precision) AS low,
+                                 (CAST(:up AS double precision) - :low) / :splits AS step_width) AS w,
+                         generate_series(0, CAST(:splits AS int)) AS g,
+                         LATERAL (SELECT w.low + g * w.step_width AS alpha) AS a;
+"""
+_INSERT_PERMUTATIONS = """WITH RECURSIVE grid AS MATERIALIZED (
+                                SELECT aid, deg, sin_deg, cos_deg FROM alphas
+                            ), perms(alphas, sins, coss, aids, depth) AS (
+                                SELECT ARRAY[deg], ARRAY[sin_deg], ARRAY[cos_deg], ARRAY[aid], 1 FROM grid
+                                UNION ALL
+                                SELECT perms.alphas || a.deg, perms.sins || a.sin_deg, perms.coss || a.cos_deg, perms.aids || a.aid, perms.depth + 1
+                                FROM perms, grid AS a
+                                WHERE perms.depth < :permutation_length
+                            )
+                            INSERT INTO permutations (alphas, sins, coss)
+                            SELECT perms.alphas, perms.sins, perms.coss || 1::double precision
+                            FROM perms WHERE perms.depth = :permutation_length ORDER BY perms.aids;
+                            CREATE INDEX permutations_pending_idx ON permutations (id) WHERE NOT consumed;
+"""
+
+
+def init_tables(columns: list[str], bounds: list[tuple]):
     """
-    try:
-        filter_func = """CREATE OR REPLACE FUNCTION filter_clusters(minPts int) RETURNS void AS $$
-                        BEGIN
-                            DELETE 
-                            FROM clusters
-                            WHERE array_length(cluster, 1) < minPts;  
-                        END;
-                        $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=filter_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating filter_clusters function: {e}")
-
-
-
-def create_delete_clustered_objects_function(db: Postgresql_DB_API):
-    """
-    Creates the delete_clustered_objects function.
+    Initializes the necessary tables and inserts initial data.
 
     Description:
-    Creates a PostgreSQL function to delete clustered objects from the 'data' and 'deltas' tables.
+    Collects the statements physically ordering the 'data' table, defining the alpha values and inserting all
+    permutations into the 'permutations' table.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
-    startid (int): The starting cluster ID from which to delete objects.
+    columns (list[str]): The attribute columns of the 'data' table.
+    bounds (list[tuple]): The minimum and maximum of every attribute column.
 
     Returns:
-    None
+    list[str]: The SQL statements initializing the tables.
     """
-    try:
-        delete_clustered_objects_func = """CREATE OR REPLACE FUNCTION delete_clustered_objects(startid int) RETURNS void AS $$
-                                            DECLARE
-                                                cl clusters;
-                                                objects_to_delete int[];
-                                            BEGIN
-                                                IF (SELECT COUNT(*) FROM clusters WHERE clusterid >= startid) = 0 THEN
-                                                    RETURN;
-                                                END IF;
-                                                FOR cl in (SELECT * FROM clusters WHERE clusterid >= startid) LOOP
-                                                    objects_to_delete  := objects_to_delete || cl.cluster; 
-                                                END LOOP;
-                                                IF objects_to_delete IS NULL THEN 
-                                                    RETURN;
-                                                END IF;
-                                                objects_to_delete := uniq(objects_to_delete);                                            
-                                                FOR o in 1..array_length(objects_to_delete, 1) LOOP
-                                                    DELETE FROM deltas WHERE oid = objects_to_delete[o];
-                                                    DELETE FROM data WHERE oid = objects_to_delete[o]; 
-                                                END LOOP;
-                                            END;
-                                        $$ LANGUAGE PLPGSQL;  
-        """
-        db.execute_engine_query(query=delete_clustered_objects_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating delete_clustered_objects function: {e}")
-
-
-def create_clean_deltas_table_function(db: Postgresql_DB_API):
-    """
-    Creates the clean_deltas_table function.
+    return [cluster_data(columns, bounds), create_alphas_view(), insert_permutations()]
+
+
+def init_table_params(columns: list[str]):
+    """
+    Provides the values bound to the statements initializing the tables.
 
     Description:
-    Creates a PostgreSQL function to clean the 'deltas' table by deleting all entries.
+    The number of splits, the range of the alpha values and the number of alphas per permutation are passed as bind
+    parameters instead of being formatted into the SQL text. The number of alphas per permutation is one less than the
+    number of attribute columns, which are already known in Python.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    columns (list[str]): The attribute columns of the 'data' table.
 
     Returns:
-    None
+    dict: The values of the bind parameters 'splits', 'low', 'up' and 'permutation_length'.
     """
-    try:
-        clean_deltas_func = """CREATE OR REPLACE FUNCTION clean_deltas_table() RETURNS void AS $$
-                                BEGIN
-                                
-                                    DELETE FROM deltas;
-                                
-                                END;
-                            $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=clean_deltas_func)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed creating clean_deltas_table function: {e}")
+    return {"splits": SPLITS, "low": 0, "up": 180, "permutation_length": len(columns) - 1}
 
 
-def init_tables(db: Postgresql_DB_API):
+def cluster_data(columns: list[str], bounds: list[tuple]):
     """
-    Initializes the necessary tables and inserts initial data.
+    Physically orders the 'data' table.
 
     Description:
-    Calls functions to insert initial alpha values and the first permutation into the respective tables.
+    Builds a Z-order index over the attributes of the 'data' table and rewrites the table in index order with CLUSTER,
+    followed by ANALYZE.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    columns (list[str]): The attribute columns of the 'data' table.
+    bounds (list[tuple]): The minimum and maximum of every attribute column.
 
     Returns:
-    None
+    str: The SQL statements ordering the table.
     """
-    try:
-        insert_alphas(db=db)
-        insert_first_permutation(db=db)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed initializing tables: {e}")
+    bits = min(16, 63 // len(columns))
+    coords = []
+    for column, (low, high) in zip(columns, bounds):
+        low = low if low is not None else 0
+        scale = ((2 ** bits) - 1) / (high - low) if high is not None and high != low else 0
+        coords.append(f'floor(("{column}" - ({float(low)!r})) * {float(scale)!r})::int')
+    cluster_statements = ("CREATE INDEX data_zorder_idx ON data (zorder_key(ARRAY[" + ", ".join(coords) + "], "
+                          + str(bits) + "));\n"
+                          + "CLUSTER data USING data_zorder_idx;\n"
+                          + "ANALYZE data;")
+    return cluster_statements
 
 
-def insert_alphas(db: Postgresql_DB_API):
+def create_alphas_view():
     """
-    Creates and executes the insert_alphas function.
+    Creates the 'alphas' view.
 
     Description:
-    Creates a PostgreSQL function to insert alpha values into the 'alphas' table. The values are generated based on the provided range and splits.
+    Creates the 'alphas' view with columns 'aid', 'deg', 'sin_deg' and 'cos_deg', generating splits + 1 alpha values
+    from low to up degrees.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    str: The SQL statement creating the view.
     """
-    try:
-        insert_func = """CREATE OR REPLACE FUNCTION insert_alphas(s int, low double precision, up double precision) RETURNS void AS $$
-                        DECLARE 
-                         step_width double precision;
-                         alpha double precision; 
-                         aid int; 
-                         insertion text;
-                        BEGIN
-                          step_width := (up - low) / s;
-                          alpha := low;
-                          aid := 1;
-                          WHILE alpha <= up LOOP
-                            INSERT INTO alphas VALUES (aid, alpha);
-                            alpha := alpha + step_width;
-                            aid := aid + 1;
-                          END LOOP;
-                        END;
-                       $$ LANGUAGE PLPGSQL;
-        """
-        db.execute_engine_query(query=insert_func)
-        db.execute_engine_query(query=
-                """DO $$ 
-                            BEGIN 
-                            PERFORM insert_alphas("""
-                + str(SPLITS)
-                + """, 0, 180);
-                            END;
-                            $$;
-                         """
-            )
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed inserting alpha values: {e}")
+    return _CREATE_ALPHAS_VIEW
 
 
-def insert_first_permutation(db: Postgresql_DB_API):
+def insert_permutations():
     """
-    Creates and executes the insert_first_permutation function.
+    Inserts every permutation into the 'permutations' table.
 
     Description:
-    Creates a PostgreSQL function to insert the first permutation into the 'next_permutation' table. This initializes the permutation process.
+    Inserts every permutation of alpha values into the 'permutations' table and indexes the pending permutations.
 
     Parameters:
-    db (Postgresql_DB_API): The database API instance used for database operations.
+    None
 
     Returns:
-    None
+    str: The SQL statements inserting the permutations and indexing them.
     """
-    try:
-        insert_permutation = """CREATE OR REPLACE FUNCTION insert_first_permutation() RETURNS void AS $$
-                                DECLARE
-                                    d int;
-                                BEGIN
-                                
-                                d = (SELECT get_dimension() - 1);
-                                INSERT INTO next_permutation VALUES (0, d);
-                                FOR dimension in 1..d LOOP
-                                    INSERT INTO next_permutation VALUES (dimension, 1);
-                                END LOOP;
-                                END;
-                               $$ LANGUAGE PLPGSQL;   
-        """
-        db.execute_engine_query(query=insert_permutation)
-        db.execute_engine_query(query=
-                         """DO $$ 
-                            BEGIN 
-                            PERFORM insert_first_permutation();
-                            END;
-                            $$;
-                         """)
-    except Exception as e:
-        logging.error(f"{datetime.now()} - Failed inserting first permutation: {e}")
-    
+    return _INSERT_PERMUTATIONS